@@ -0,0 +1,101 @@
+/**
+ * Unit tests for the static build asset copier
+ */
+
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { writeFileIfChanged, copyImages } from './assetCopier';
+
+describe('writeFileIfChanged', () => {
+  let tmpDir: string;
+
+  beforeEach(() => {
+    tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'precept-build-'));
+  });
+
+  afterEach(() => {
+    fs.rmSync(tmpDir, { recursive: true, force: true });
+  });
+
+  it('writes a file that does not exist', () => {
+    const file = path.join(tmpDir, 'page.html');
+
+    expect(writeFileIfChanged(file, '<p>a</p>')).toBe(true);
+    expect(fs.readFileSync(file, 'utf-8')).toBe('<p>a</p>');
+  });
+
+  it('leaves identical content untouched', () => {
+    const file = path.join(tmpDir, 'page.html');
+    fs.writeFileSync(file, '<p>a</p>', 'utf-8');
+    const past = new Date((Math.floor(Date.now() / 1000) - 60) * 1000);
+    fs.utimesSync(file, past, past);
+
+    expect(writeFileIfChanged(file, '<p>a</p>')).toBe(false);
+    expect(fs.statSync(file).mtimeMs).toBe(past.getTime());
+  });
+
+  it('rewrites changed content', () => {
+    const file = path.join(tmpDir, 'page.html');
+    fs.writeFileSync(file, '<p>a</p>', 'utf-8');
+
+    expect(writeFileIfChanged(file, '<p>b</p>')).toBe(true);
+    expect(fs.readFileSync(file, 'utf-8')).toBe('<p>b</p>');
+  });
+});
+
+describe('copyImages', () => {
+  let srcDir: string;
+  let outDir: string;
+  let srcImage: string;
+  let destImage: string;
+
+  beforeEach(() => {
+    srcDir = fs.mkdtempSync(path.join(os.tmpdir(), 'precept-src-'));
+    outDir = fs.mkdtempSync(path.join(os.tmpdir(), 'precept-out-'));
+    fs.mkdirSync(path.join(srcDir, 'images'));
+    srcImage = path.join(srcDir, 'images', 'logo.png');
+    destImage = path.join(outDir, 'images', 'logo.png');
+  });
+
+  afterEach(() => {
+    fs.rmSync(srcDir, { recursive: true, force: true });
+    fs.rmSync(outDir, { recursive: true, force: true });
+  });
+
+  it('copies images and carries over the source mtime', () => {
+    fs.writeFileSync(srcImage, 'aaaa');
+    const past = new Date((Math.floor(Date.now() / 1000) - 60) * 1000);
+    fs.utimesSync(srcImage, past, past);
+
+    copyImages(srcDir, outDir);
+
+    expect(fs.readFileSync(destImage, 'utf-8')).toBe('aaaa');
+    expect(fs.statSync(destImage).mtimeMs).toBe(past.getTime());
+  });
+
+  it('skips images whose size and mtime match the source', () => {
+    fs.writeFileSync(srcImage, 'aaaa');
+    copyImages(srcDir, outDir);
+    fs.writeFileSync(destImage, 'bbbb');
+    const srcStat = fs.statSync(srcImage);
+    fs.utimesSync(destImage, srcStat.atime, srcStat.mtime);
+
+    copyImages(srcDir, outDir);
+
+    expect(fs.readFileSync(destImage, 'utf-8')).toBe('bbbb');
+  });
+
+  it('recopies a same-size replacement with an older mtime', () => {
+    fs.writeFileSync(srcImage, 'aaaa');
+    copyImages(srcDir, outDir);
+
+    fs.writeFileSync(srcImage, 'bbbb');
+    const older = new Date((Math.floor(Date.now() / 1000) - 3600) * 1000);
+    fs.utimesSync(srcImage, older, older);
+
+    copyImages(srcDir, outDir);
+
+    expect(fs.readFileSync(destImage, 'utf-8')).toBe('bbbb');
+  });
+});
@@ -24,10 +24,10 @@ export function copyStaticAssets(outputDir: string, themeName: string = 'default
   const themeCss = generateStaticThemeCss(themeName);
   const pageCss = generateStaticPageCss(mobileBreakpoint);
   const combinedCss = `${themeCss}\n\n${pageCss}\n\n${PRECEPT_CSS_TEMPLATE}`;
-  fs.writeFileSync(path.join(staticDir, 'precept.css'), combinedCss, 'utf-8');
+  writeFileIfChanged(path.join(staticDir, 'precept.css'), combinedCss);
 
   // JavaScript
-  fs.writeFileSync(path.join(staticDir, 'precept.js'), PRECEPT_JS_TEMPLATE, 'utf-8');
+  writeFileIfChanged(path.join(staticDir, 'precept.js'), PRECEPT_JS_TEMPLATE);
 }
 
 /**
@@ -72,11 +72,48 @@ function copyDirRecursive(src: string, dest: string): void {
     if (entry.isDirectory()) {
       copyDirRecursive(srcPath, destPath);
     } else {
-      fs.copyFileSync(srcPath, destPath);
+      const srcStat = fs.statSync(srcPath);
+      if (!isUpToDate(srcStat, destPath)) {
+        fs.copyFileSync(srcPath, destPath);
+        // Carry the source mtime over so the next build can compare for equality
+        fs.utimesSync(destPath, srcStat.atime, srcStat.mtime);
+      }
     }
   }
 }
 
+/**
+ * Write a UTF-8 file only when its content differs from what is on disk.
+ *
+ * Leaves the mtime of unchanged outputs alone so browsers, live-reload
+ * servers and file watchers do not treat every rebuild as a change.
+ * Returns true if the file was written.
+ */
+export function writeFileIfChanged(filePath: string, content: string): boolean {
+  try {
+    if (fs.readFileSync(filePath, 'utf-8') === content) {
+      return false;
+    }
+  } catch {
+    // Missing or unreadable — write it
+  }
+  fs.writeFileSync(filePath, content, 'utf-8');
+  return true;
+}
+
+/**
+ * Check whether a copied file is already current: same size and the same
+ * mtime (to the millisecond) that was carried over from the source on copy.
+ */
+function isUpToDate(src: fs.Stats, destPath: string): boolean {
+  try {
+    const dest = fs.statSync(destPath);
+    return src.size === dest.size && Math.floor(src.mtimeMs) === Math.floor(dest.mtimeMs);
+  } catch {
+    return false;
+  }
+}
+
 /**
  * Create a directory if it doesn't exist (recursive).
  */
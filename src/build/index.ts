@@ -4,4 +4,4 @@
 
 export { buildStaticSite, type BuildOptions, type BuildResult } from './staticBuilder';
 export { renderPage, type PageTemplateContext, generateStaticPageCss, DEFAULT_MOBILE_BREAKPOINT } from './templateEngine';
-export { copyStaticAssets, copyImages } from './assetCopier';
+export { copyStaticAssets, copyImages, writeFileIfChanged } from './assetCopier';
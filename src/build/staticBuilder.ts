@@ -12,9 +12,12 @@ import { renderDocument } from '../renderer/htmlEmitter';
 import { RenderContext } from '../renderer/directiveRenderer';
 import { buildTocTree, getNavLinks, TocTree } from '../renderer/tocBuilder';
 import { renderPage, PageTemplateContext } from './templateEngine';
-import { copyStaticAssets, copyImages } from './assetCopier';
+import { copyStaticAssets, copyImages, writeFileIfChanged } from './assetCopier';
 import { PreceptConfig, RequirementIndex } from '../types';
 
+/** Classes that precept.js attaches behaviour to */
+const SCRIPTED_CLASS_REGEX = /\bprecept-(?:clickable|graphic-uml)\b/;
+
 export interface BuildOptions {
   /** Absolute path to the root RST file (e.g. index.rst) */
   entryPoint: string;
@@ -128,7 +131,8 @@ export function buildStaticSite(options: BuildOptions): BuildResult {
         nextSlug: nav.next,
         projectName: projectName,
         cssPath: `${pathPrefix}_static/precept.css`,
-        jsPath: `${pathPrefix}_static/precept.js`,
+        // Only reference precept.js on pages it has something to act on
+        jsPath: SCRIPTED_CLASS_REGEX.test(bodyHtml) ? `${pathPrefix}_static/precept.js` : undefined,
         pathPrefix,
       };
 
@@ -138,7 +142,7 @@ export function buildStaticSite(options: BuildOptions): BuildResult {
       if (!fs.existsSync(outDir)) {
         fs.mkdirSync(outDir, { recursive: true });
       }
-      fs.writeFileSync(outFile, pageHtml, 'utf-8');
+      writeFileIfChanged(outFile, pageHtml);
       filesBuilt++;
     } catch (err) {
       errors.push(`Error rendering ${slug}.rst: ${err instanceof Error ? err.message : String(err)}`);
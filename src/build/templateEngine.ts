@@ -16,7 +16,8 @@ export interface PageTemplateContext {
   nextSlug: string | null;
   projectName: string;
   cssPath: string;
-  jsPath: string;
+  /** Path to precept.js; omitted on pages with nothing for the script to act on */
+  jsPath?: string;
   /** Relative prefix to reach root from current page (e.g. "../../" for nested pages) */
   pathPrefix?: string;
 }
@@ -28,6 +29,7 @@ export function renderPage(ctx: PageTemplateContext): string {
   const prefix = ctx.pathPrefix || '';
   const sidebar = renderSidebar(ctx.tocEntries, ctx.currentSlug, prefix);
   const navHtml = renderNavigation(ctx.prevSlug, ctx.nextSlug, prefix);
+  const scriptTag = ctx.jsPath ? `\n<script src="${escapeAttr(ctx.jsPath)}"></script>` : '';
 
   return `<!DOCTYPE html>
 <html lang="en">
@@ -66,8 +68,7 @@ export function renderPage(ctx: PageTemplateContext): string {
     });
   }
 })();
-</script>
-<script src="${escapeAttr(ctx.jsPath)}"></script>
+</script>${scriptTag}
 </body>
 </html>`;
 }
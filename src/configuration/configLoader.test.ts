@@ -0,0 +1,68 @@
+jest.mock('vscode', () => ({
+  window: {
+    showInformationMessage: jest.fn(),
+  },
+}), { virtual: true });
+
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { loadConfigFromJson, clearParsedConfigCache } from './configLoader';
+
+describe('loadConfigFromJson', () => {
+  let tmpDir: string;
+  let jsonPath: string;
+
+  beforeEach(() => {
+    tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'precept-config-'));
+    jsonPath = path.join(tmpDir, 'precept.json');
+    clearParsedConfigCache();
+  });
+
+  afterEach(() => {
+    fs.rmSync(tmpDir, { recursive: true, force: true });
+  });
+
+  it('reuses the parsed config while file content is unchanged', async () => {
+    fs.writeFileSync(jsonPath, JSON.stringify({ statuses: [{ status: 'draft' }] }));
+
+    const first = await loadConfigFromJson(jsonPath);
+    const second = await loadConfigFromJson(jsonPath);
+
+    expect(first.success).toBe(true);
+    expect(second.config).toBe(first.config);
+  });
+
+  it('re-parses when file content changes', async () => {
+    fs.writeFileSync(jsonPath, JSON.stringify({ statuses: [{ status: 'draft' }] }));
+    const first = await loadConfigFromJson(jsonPath);
+
+    fs.writeFileSync(jsonPath, JSON.stringify({ statuses: [{ status: 'approved' }] }));
+    const second = await loadConfigFromJson(jsonPath);
+
+    expect(second.config).not.toBe(first.config);
+    expect(second.config?.statuses.map(s => s.status)).toEqual(['approved']);
+  });
+
+  it('does not cache parse failures', async () => {
+    fs.writeFileSync(jsonPath, '{ broken');
+    const broken = await loadConfigFromJson(jsonPath);
+    expect(broken.success).toBe(false);
+
+    fs.writeFileSync(jsonPath, JSON.stringify({}));
+    const fixed = await loadConfigFromJson(jsonPath);
+    expect(fixed.success).toBe(true);
+  });
+
+  it('freezes object type, level, link type and status entries', async () => {
+    fs.writeFileSync(jsonPath, JSON.stringify({
+      objectTypes: [{ type: 'requirement' }],
+      linkTypes: [{ option: 'satisfies' }],
+    }));
+
+    const { config } = await loadConfigFromJson(jsonPath);
+
+    expect(Object.isFrozen(config?.objectTypes[0])).toBe(true);
+    expect(Object.isFrozen(config?.linkTypes[0])).toBe(true);
+  });
+});
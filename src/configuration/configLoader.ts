@@ -6,6 +6,7 @@
 import * as vscode from 'vscode';
 import * as path from 'path';
 import * as fs from 'fs';
+import * as crypto from 'crypto';
 import {
   PreceptConfig,
   ObjectType,
@@ -19,7 +20,7 @@ import {
   SigningConfig,
   ConfigLoadResult,
 } from '../types';
-import { DEFAULT_CONFIG, buildIdRegex } from './defaults';
+import { DEFAULT_CONFIG, REFERENCES_LINK_TYPE, buildIdRegex } from './defaults';
 import { getSettings } from './settingsManager';
 import {
   needsRepair,
@@ -66,7 +67,7 @@ function ensureReferencesLinkType(linkTypes: LinkType[]): LinkType[] {
   if (linkTypes.some(lt => lt.option === 'references')) {
     return linkTypes;
   }
-  return [...linkTypes, { option: 'references', incoming: 'referenced_by', outgoing: 'references' }];
+  return [...linkTypes, REFERENCES_LINK_TYPE];
 }
 
 /**
@@ -91,12 +92,12 @@ function parseRawConfig(raw: {
     title: String(t.title || t.type || ''),
     color: t.color ? String(t.color) : undefined,
     style: t.style ? String(t.style) : undefined,
-  })).filter(t => t.type);
+  })).filter(t => t.type).map(e => Object.freeze(e));
 
   const levels: Level[] = (raw.levels || []).map((l) => ({
     level: String(l.level || ''),
     title: String(l.title || l.level || ''),
-  })).filter(l => l.level);
+  })).filter(l => l.level).map(e => Object.freeze(e));
 
   const rawIdConfig = raw.idConfig;
   const idConfig: IdConfig = rawIdConfig ? {
@@ -111,12 +112,12 @@ function parseRawConfig(raw: {
     incoming: String(l.incoming || l.option || ''),
     outgoing: String(l.outgoing || l.option || ''),
     style: l.style ? String(l.style) : undefined,
-  })).filter(l => l.option);
+  })).filter(l => l.option).map(e => Object.freeze(e));
 
   const statuses: Status[] = (raw.statuses || []).map((s) => ({
     status: String(s.status || ''),
     color: s.color ? String(s.color) : undefined,
-  })).filter(s => s.status);
+  })).filter(s => s.status).map(e => Object.freeze(e));
 
   // Parse custom fields
   const customFields: CustomFields = {};
@@ -154,6 +155,7 @@ function parseRawConfig(raw: {
     idConfig,
     linkTypes: ensureReferencesLinkType(linkTypes.length > 0 ? linkTypes : DEFAULT_CONFIG.linkTypes),
     statuses: statuses.length > 0 ? statuses : DEFAULT_CONFIG.statuses,
+    defaultStatus: raw.defaultStatus ? String(raw.defaultStatus) : undefined,
     customFields,
     headingStyles: headingStyles.length > 0 ? headingStyles : DEFAULT_CONFIG.headingStyles,
     id_regex,
@@ -163,24 +165,48 @@ function parseRawConfig(raw: {
   };
 }
 
+/**
+ * Parsed precept.json results keyed by file path.
+ * An entry is reused only while the SHA-256 of the file content still matches,
+ * so unchanged files skip JSON parsing and normalization on reload.
+ */
+const parsedConfigCache = new Map<string, { hash: string; result: ConfigLoadResult }>();
+
+/**
+ * Clear the parsed precept.json cache
+ */
+export function clearParsedConfigCache(): void {
+  parsedConfigCache.clear();
+}
+
 /**
  * Load configuration from precept.json
  */
 export async function loadConfigFromJson(jsonPath: string): Promise<ConfigLoadResult> {
   try {
-    const content = await fs.promises.readFile(jsonPath, 'utf-8');
-    const rawConfig = JSON.parse(content);
+    const bytes = await fs.promises.readFile(jsonPath);
+    const hash = crypto.createHash('sha256').update(bytes).digest('hex');
+
+    const cached = parsedConfigCache.get(jsonPath);
+    if (cached && cached.hash === hash) {
+      return { ...cached.result };
+    }
+
+    const rawConfig = JSON.parse(bytes.toString('utf-8'));
     const config = parseRawConfig(rawConfig);
     const theme = typeof rawConfig.theme === 'string' ? rawConfig.theme : undefined;
     const mobileBreakpoint = typeof rawConfig.mobileBreakpoint === 'number' ? rawConfig.mobileBreakpoint : undefined;
 
-    return {
+    const result: ConfigLoadResult = {
       success: true,
       config,
       source: 'precept.json',
       theme,
       mobileBreakpoint,
     };
+    parsedConfigCache.set(jsonPath, { hash, result });
+
+    return { ...result };
   } catch (error) {
     return {
       success: false,
@@ -204,9 +230,11 @@ export function loadConfigFromSettings(): ConfigLoadResult {
     };
   }
 
+  const objectTypes: ObjectType[] = settings.config.customTypes.map(t => Object.freeze({ ...t }));
+
   const config: PreceptConfig = {
     ...DEFAULT_CONFIG,
-    objectTypes: settings.config.customTypes,
+    objectTypes,
     headingStyles: DEFAULT_CONFIG.headingStyles,
   };
 
@@ -236,7 +264,7 @@ export async function loadConfiguration(workspaceRoot: string): Promise<ConfigLo
   if (jsonPath) {
     const jsonResult = await loadConfigFromJson(jsonPath);
     if (jsonResult.success) {
-      return jsonResult; // includes theme if present
+      return { ...jsonResult, configPath: jsonPath }; // includes theme if present
     }
     // precept.json exists but failed to parse — report the failure
     return {
@@ -312,6 +340,7 @@ export class ConfigurationManager {
   private config: PreceptConfig = DEFAULT_CONFIG;
   private configSource: 'precept.json' | 'settings' | 'defaults' = 'defaults';
   private preceptJsonPath: string | null = null;
+  private watchedRoot: string | null = null;
   private themeName: string = 'default';
   private pendingErrorDialog: boolean = false;
   private errorDismissed: boolean = false;
@@ -345,6 +374,15 @@ export class ConfigurationManager {
       await this.checkAndOfferRepair(workspaceRoot);
     }
 
+    // Watchers are registered once per workspace root; repeated
+    // initialization only reloads the configuration
+    if (this.watchedRoot === workspaceRoot) {
+      return;
+    }
+    this.disposables.forEach(d => d.dispose());
+    this.disposables = [];
+    this.watchedRoot = workspaceRoot;
+
     // Set up precept.json watcher
     this.disposables.push(
       createConfigWatcher(workspaceRoot, () => this.reload(workspaceRoot))
@@ -372,6 +410,7 @@ export class ConfigurationManager {
       this.fallbackDefaults = false;
       this.config = result.config;
       this.configSource = result.source;
+      this.preceptJsonPath = result.configPath ?? null;
       this.themeName = result.theme || 'default';
       this.onConfigChangeEmitter.fire(this.config);
 
@@ -418,6 +457,7 @@ export class ConfigurationManager {
       this.errorDismissed = false;
       this.config = result.config;
       this.configSource = result.source;
+      this.preceptJsonPath = result.configPath ?? null;
       this.themeName = result.theme || 'default';
       this.onConfigChangeEmitter.fire(this.config);
       return;
@@ -434,7 +474,7 @@ export class ConfigurationManager {
    * If accepted, writes the updated file and lets the file watcher reload.
    */
   private async checkAndOfferRepair(workspaceRoot: string): Promise<void> {
-    const jsonPath = await findPreceptJsonPath(workspaceRoot);
+    const jsonPath = this.preceptJsonPath ?? await findPreceptJsonPath(workspaceRoot);
     if (!jsonPath) {
       return;
     }
@@ -527,6 +567,7 @@ export class ConfigurationManager {
   public dispose(): void {
     this.disposables.forEach(d => d.dispose());
     this.disposables = [];
+    this.watchedRoot = null;
     this.onConfigChangeEmitter.dispose();
     this.onConfigErrorEmitter.dispose();
   }
@@ -16,8 +16,14 @@ import {
   getObjectTypeInfo,
   getLevelInfo,
   getStatusInfo,
+  getLinkTypeInfo,
+  getLinkOptionSet,
+  getConfigLookup,
+  canonicalizeConfigValue,
+  resolveStatus,
   buildIdRegex,
   formatId,
+  createIdFormatter,
   parseIdNumber,
 } from './defaults';
 
@@ -77,6 +83,15 @@ describe('Configuration Defaults', () => {
     });
   });
 
+  describe('getLinkOptionSet', () => {
+    it('should contain the same names as getLinkOptionNames', () => {
+      const set = getLinkOptionSet(DEFAULT_CONFIG);
+
+      expect(Array.from(set).sort()).toEqual(getLinkOptionNames(DEFAULT_CONFIG).sort());
+      expect(set.has('implemented_by')).toBe(true);
+    });
+  });
+
   describe('getStatusNames', () => {
     it('should return all status names', () => {
       const statuses = getStatusNames(DEFAULT_CONFIG);
@@ -134,6 +149,68 @@ describe('Configuration Defaults', () => {
     });
   });
 
+  describe('getLinkTypeInfo', () => {
+    it('should find link type by option', () => {
+      const info = getLinkTypeInfo(DEFAULT_CONFIG, 'satisfies');
+
+      expect(info).toBeDefined();
+      expect(info?.incoming).toBe('satisfied_by');
+    });
+
+    it('should return undefined for non-existent option', () => {
+      expect(getLinkTypeInfo(DEFAULT_CONFIG, 'nonexistent')).toBeUndefined();
+    });
+  });
+
+  describe('getConfigLookup', () => {
+    it('should reuse the lookup for the same config object', () => {
+      expect(getConfigLookup(DEFAULT_CONFIG)).toBe(getConfigLookup(DEFAULT_CONFIG));
+    });
+
+    it('should keep the first entry for duplicate keys', () => {
+      const config = {
+        ...DEFAULT_CONFIG,
+        statuses: [
+          { status: 'draft', color: '#111111' },
+          { status: 'draft', color: '#222222' },
+        ],
+      };
+
+      expect(getStatusInfo(config, 'draft')?.color).toBe('#111111');
+    });
+  });
+
+  describe('canonicalizeConfigValue', () => {
+    it('should collect configured type, level and status names only', () => {
+      const lookup = getConfigLookup(DEFAULT_CONFIG);
+
+      expect(lookup.canonicalValues.has('requirement')).toBe(true);
+      expect(lookup.canonicalValues.has('stakeholder')).toBe(true);
+      expect(lookup.canonicalValues.has('draft')).toBe(true);
+      expect(lookup.canonicalValues.has('satisfies')).toBe(false);
+    });
+
+    it('should pass unknown values through unchanged', () => {
+      expect(canonicalizeConfigValue(DEFAULT_CONFIG, 'not_configured')).toBe('not_configured');
+    });
+  });
+
+  describe('resolveStatus', () => {
+    it('should keep an explicit status', () => {
+      expect(resolveStatus(DEFAULT_CONFIG, 'approved')).toBe('approved');
+    });
+
+    it('should fall back to draft when no default is configured', () => {
+      expect(resolveStatus(DEFAULT_CONFIG, undefined)).toBe('draft');
+    });
+
+    it('should fall back to the configured default status', () => {
+      const config = { ...DEFAULT_CONFIG, defaultStatus: 'review' };
+
+      expect(resolveStatus(config, '')).toBe('review');
+    });
+  });
+
   describe('buildIdRegex', () => {
     it('should build regex for numeric IDs', () => {
       const regex = buildIdRegex(DEFAULT_ID_CONFIG);
@@ -162,6 +239,16 @@ describe('Configuration Defaults', () => {
     });
   });
 
+  describe('createIdFormatter', () => {
+    it('should reuse one formatter per IdConfig', () => {
+      const config = { prefix: 'REQ', separator: '_', padding: 3, start: 1 };
+      const format = createIdFormatter(config);
+      expect(createIdFormatter(config)).toBe(format);
+      expect(format(7)).toBe('REQ_007');
+      expect(format(12345)).toBe('REQ_12345');
+    });
+  });
+
   describe('parseIdNumber', () => {
     it('should parse numeric IDs', () => {
       expect(parseIdNumber(DEFAULT_ID_CONFIG, '0001')).toBe(1);
@@ -58,6 +58,16 @@ export const DEFAULT_ID_CONFIG: IdConfig = {
   start: 1,
 };
 
+/**
+ * Built-in link type used for :termref:, :paramval:, and :item: inline refs.
+ * Shared by the defaults and every loaded config that doesn't declare it.
+ */
+export const REFERENCES_LINK_TYPE: LinkType = Object.freeze({
+  option: 'references',
+  incoming: 'referenced_by',
+  outgoing: 'references',
+});
+
 export const DEFAULT_LINK_TYPES: LinkType[] = [
   {
     option: 'links',
@@ -84,11 +94,7 @@ export const DEFAULT_LINK_TYPES: LinkType[] = [
     incoming: 'tested_by',
     outgoing: 'tests',
   },
-  {
-    option: 'references',
-    incoming: 'referenced_by',
-    outgoing: 'references',
-  },
+  REFERENCES_LINK_TYPE,
 ];
 
 export const DEFAULT_STATUSES: Status[] = [
@@ -98,6 +104,16 @@ export const DEFAULT_STATUSES: Status[] = [
   { status: 'implemented', color: '#2196F3' },
 ];
 
+// Default entries are shared by every config that falls back to them
+for (const entries of [DEFAULT_OBJECT_TYPES, DEFAULT_LEVELS, DEFAULT_LINK_TYPES, DEFAULT_STATUSES]) {
+  entries.forEach(entry => Object.freeze(entry));
+}
+
+/**
+ * Status assumed for items without a :status: option when the config sets none
+ */
+export const DEFAULT_STATUS = 'draft';
+
 /**
  * Default custom fields (empty - user defines their own)
  */
@@ -187,25 +203,126 @@ export function getStatusNames(config: PreceptConfig): string[] {
   return config.statuses.map(s => s.status);
 }
 
+/**
+ * Keyed views of the configuration lists for constant-time lookup
+ */
+export interface ConfigLookup {
+  objectTypes: Map<string, ObjectType>;   // type -> object type
+  levels: Map<string, Level>;             // level -> level
+  linkTypes: Map<string, LinkType>;       // option -> link type
+  statuses: Map<string, Status>;          // status -> status
+  linkOptionNames: Set<string>;           // option, incoming and outgoing names
+  canonicalValues: Map<string, string>;   // type/level/status name -> config's own string
+}
+
+/**
+ * Lookups built per config object. Configs are replaced, never mutated,
+ * on reload, so entries are dropped together with the config they index.
+ */
+const lookupCache = new WeakMap<PreceptConfig, ConfigLookup>();
+
+/**
+ * Index a list by key, keeping the first entry for duplicate keys
+ */
+function indexBy<T>(items: T[], key: (item: T) => string): Map<string, T> {
+  const map = new Map<string, T>();
+  for (const item of items) {
+    const k = key(item);
+    if (!map.has(k)) {
+      map.set(k, item);
+    }
+  }
+  return map;
+}
+
+/**
+ * Collect the configured type, level and status names, mapped to the
+ * string instance held by the config
+ */
+function buildCanonicalValues(config: PreceptConfig): Map<string, string> {
+  const values = new Map<string, string>();
+  const add = (value: string): void => {
+    if (!values.has(value)) {
+      values.set(value, value);
+    }
+  };
+  config.objectTypes.forEach(t => add(t.type));
+  config.levels.forEach(l => add(l.level));
+  config.statuses.forEach(s => add(s.status));
+  return values;
+}
+
+/**
+ * Get keyed lookups for a configuration, building them on first use
+ */
+export function getConfigLookup(config: PreceptConfig): ConfigLookup {
+  let lookup = lookupCache.get(config);
+  if (!lookup) {
+    lookup = {
+      objectTypes: indexBy(config.objectTypes, t => t.type),
+      levels: indexBy(config.levels, l => l.level),
+      linkTypes: indexBy(config.linkTypes, lt => lt.option),
+      statuses: indexBy(config.statuses, s => s.status),
+      linkOptionNames: new Set(getLinkOptionNames(config)),
+      canonicalValues: buildCanonicalValues(config),
+    };
+    lookupCache.set(config, lookup);
+  }
+  return lookup;
+}
+
+/**
+ * Get the set of valid link option names (option, incoming and outgoing)
+ */
+export function getLinkOptionSet(config: PreceptConfig): ReadonlySet<string> {
+  return getConfigLookup(config).linkOptionNames;
+}
+
+/**
+ * Return the config's own instance of a configured name, or the value unchanged.
+ *
+ * Parsed options are fresh substrings of their source line; mapping known
+ * names back to one shared instance keeps thousands of indexed objects from
+ * each holding their own copy of "requirement", "draft", etc.
+ */
+export function canonicalizeConfigValue(config: PreceptConfig, value: string): string {
+  return getConfigLookup(config).canonicalValues.get(value) ?? value;
+}
+
 /**
  * Get object type info
  */
 export function getObjectTypeInfo(config: PreceptConfig, type: string): ObjectType | undefined {
-  return config.objectTypes.find(t => t.type === type);
+  return getConfigLookup(config).objectTypes.get(type);
 }
 
 /**
  * Get level info
  */
 export function getLevelInfo(config: PreceptConfig, level: string): Level | undefined {
-  return config.levels.find(l => l.level === level);
+  return getConfigLookup(config).levels.get(level);
+}
+
+/**
+ * Get link type info by option name
+ */
+export function getLinkTypeInfo(config: PreceptConfig, option: string): LinkType | undefined {
+  return getConfigLookup(config).linkTypes.get(option);
 }
 
 /**
  * Get status info
  */
 export function getStatusInfo(config: PreceptConfig, status: string): Status | undefined {
-  return config.statuses.find(s => s.status === status);
+  return getConfigLookup(config).statuses.get(status);
+}
+
+/**
+ * Resolve an item's effective status: its own status if set,
+ * otherwise the configured default status
+ */
+export function resolveStatus(config: PreceptConfig, status?: string): string {
+  return status || config.defaultStatus || DEFAULT_STATUS;
 }
 
 /**
@@ -223,15 +340,29 @@ export function getCustomFieldValues(config: PreceptConfig, fieldName: string):
   return field ? field.map(v => v.value) : [];
 }
 
+/** Formatters compiled per IdConfig */
+const idFormatters = new WeakMap<IdConfig, (number: number) => string>();
+
+/**
+ * Get a formatter for the IdConfig. The prefix and padding are resolved
+ * once, so generating many IDs costs one padStart and one concatenation each.
+ */
+export function createIdFormatter(idConfig: IdConfig): (number: number) => string {
+  let formatter = idFormatters.get(idConfig);
+  if (!formatter) {
+    const lead = idConfig.prefix ? idConfig.prefix + idConfig.separator : '';
+    const padding = idConfig.padding;
+    formatter = (number: number) => lead + String(number).padStart(padding, '0');
+    idFormatters.set(idConfig, formatter);
+  }
+  return formatter;
+}
+
 /**
  * Format an ID number according to the IdConfig
  */
 export function formatId(idConfig: IdConfig, number: number): string {
-  const paddedNumber = String(number).padStart(idConfig.padding, '0');
-  if (idConfig.prefix) {
-    return `${idConfig.prefix}${idConfig.separator}${paddedNumber}`;
-  }
-  return paddedNumber;
+  return createIdFormatter(idConfig)(number);
 }
 
 /**
@@ -0,0 +1,73 @@
+jest.mock('vscode', () => ({
+  EventEmitter: class {
+    event = jest.fn();
+    fire = jest.fn();
+    dispose = jest.fn();
+  },
+}), { virtual: true });
+
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { IndexBuilder } from './indexBuilder';
+import { DEFAULT_CONFIG } from '../configuration/defaults';
+
+function item(id: string, links: string[] = []): string {
+  return [
+    `.. item:: Item ${id}`,
+    `   :id: ${id}`,
+    '   :type: requirement',
+    ...links,
+    '',
+    '   Description.',
+    '',
+  ].join('\n');
+}
+
+describe('IndexBuilder incoming links', () => {
+  let tmpDir: string;
+  let filePath: string;
+  let builder: IndexBuilder;
+
+  beforeEach(() => {
+    tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'precept-index-'));
+    filePath = path.join(tmpDir, 'items.rst');
+    builder = new IndexBuilder(DEFAULT_CONFIG);
+  });
+
+  afterEach(() => {
+    builder.dispose();
+    fs.rmSync(tmpDir, { recursive: true, force: true });
+  });
+
+  it('records incoming links when a file is indexed', async () => {
+    fs.writeFileSync(filePath, item('0001') + item('0002', ['   :satisfies: 0001']));
+    await builder.indexFile(filePath);
+
+    expect(builder.getIncomingLinks('0001')).toEqual({ satisfies: ['0002'] });
+    expect(builder.getIncomingLinks('0002')).toEqual({});
+  });
+
+  it('replaces incoming links when a file is re-indexed', async () => {
+    fs.writeFileSync(filePath, item('0001') + item('0002', ['   :satisfies: 0001']));
+    await builder.indexFile(filePath);
+
+    fs.writeFileSync(filePath, item('0001') + item('0002', ['   :implements: 0001']));
+    await builder.indexFile(filePath);
+
+    expect(builder.getIncomingLinks('0001')).toEqual({ implements: ['0002'] });
+  });
+
+  it('clears incoming links when the source is removed', async () => {
+    const otherPath = path.join(tmpDir, 'other.rst');
+    fs.writeFileSync(filePath, item('0001'));
+    fs.writeFileSync(otherPath, item('0002', ['   :satisfies: 0001']));
+    await builder.indexFile(filePath);
+    await builder.indexFile(otherPath);
+
+    builder.removeFile(otherPath);
+
+    expect(builder.getIncomingLinks('0001')).toEqual({});
+    expect(builder.getIndex().incomingLinks.has('0001')).toBe(false);
+  });
+});
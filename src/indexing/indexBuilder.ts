@@ -15,6 +15,9 @@ import {
 import { parseRstFile } from './rstParser';
 import { getExcludePatterns } from '../configuration/settingsManager';
 
+/** Files read concurrently during a full index build */
+const FILE_READ_CONCURRENCY = 16;
+
 /**
  * Create an empty index
  */
@@ -27,6 +30,7 @@ export function createEmptyIndex(): RequirementIndex {
     statusIndex: new Map(),
     linkGraph: new Map(),
     baselines: new Map(),
+    incomingLinks: new Map(),
   };
 }
 
@@ -69,7 +73,7 @@ function addToIndex(index: RequirementIndex, req: RequirementObject): void {
   if (!index.linkGraph.has(req.id)) {
     index.linkGraph.set(req.id, new Set());
   }
-  for (const linkedIds of Object.values(req.links)) {
+  for (const [linkType, linkedIds] of Object.entries(req.links)) {
     for (const linkedId of linkedIds) {
       index.linkGraph.get(req.id)!.add(linkedId);
 
@@ -78,6 +82,17 @@ function addToIndex(index: RequirementIndex, req: RequirementObject): void {
         index.linkGraph.set(linkedId, new Set());
       }
       index.linkGraph.get(linkedId)!.add(req.id);
+
+      // Add to incoming link index
+      let byType = index.incomingLinks.get(linkedId);
+      if (!byType) {
+        byType = new Map();
+        index.incomingLinks.set(linkedId, byType);
+      }
+      if (!byType.has(linkType)) {
+        byType.set(linkType, new Set());
+      }
+      byType.get(linkType)!.add(req.id);
     }
   }
 
@@ -154,6 +169,23 @@ function removeFromIndex(index: RequirementIndex, reqId: string): void {
   }
   index.linkGraph.delete(reqId);
 
+  // Remove from incoming link index
+  for (const [linkType, targetIds] of Object.entries(req.links)) {
+    for (const targetId of targetIds) {
+      const byType = index.incomingLinks.get(targetId);
+      const sourceIds = byType?.get(linkType);
+      if (byType && sourceIds) {
+        sourceIds.delete(reqId);
+        if (sourceIds.size === 0) {
+          byType.delete(linkType);
+        }
+        if (byType.size === 0) {
+          index.incomingLinks.delete(targetId);
+        }
+      }
+    }
+  }
+
   // Remove from baseline index
   if (req.baseline) {
     const baselineIds = index.baselines.get(req.baseline);
@@ -307,6 +339,21 @@ export class IndexBuilder {
       .filter((r): r is RequirementObject => r !== undefined);
   }
 
+  /**
+   * Get incoming links for a requirement ID
+   * Returns a map of link type -> array of source IDs
+   */
+  public getIncomingLinks(id: string): Record<string, string[]> {
+    const incoming: Record<string, string[]> = {};
+    const byType = this.index.incomingLinks.get(id);
+    if (byType) {
+      for (const [linkType, sourceIds] of byType) {
+        incoming[linkType] = Array.from(sourceIds);
+      }
+    }
+    return incoming;
+  }
+
   /**
    * Get all references to a requirement ID
    */
@@ -399,19 +446,33 @@ export class IndexBuilder {
     const totalFiles = files.length;
     let processed = 0;
 
-    for (const file of files) {
-      try {
-        await this.indexFile(file.fsPath);
-        processed++;
-
-        if (progress) {
-          progress.report({
-            message: `Indexing ${processed}/${totalFiles} files...`,
-            increment: (1 / totalFiles) * 100,
-          });
+    // Reads overlap in batches; parsing and indexing stay in file order so
+    // duplicate-ID resolution matches an incremental build
+    for (let start = 0; start < totalFiles; start += FILE_READ_CONCURRENCY) {
+      const batch = files.slice(start, start + FILE_READ_CONCURRENCY);
+      const contents = await Promise.allSettled(
+        batch.map(file => fs.promises.readFile(file.fsPath, 'utf-8'))
+      );
+
+      for (let i = 0; i < batch.length; i++) {
+        const filePath = batch[i].fsPath;
+        const result = contents[i];
+        try {
+          if (result.status === 'rejected') {
+            throw result.reason;
+          }
+          this.applyFile(filePath, result.value);
+          processed++;
+
+          if (progress) {
+            progress.report({
+              message: `Indexing ${processed}/${totalFiles} files...`,
+              increment: (1 / totalFiles) * 100,
+            });
+          }
+        } catch (error) {
+          console.error(`Error indexing ${filePath}:`, error);
         }
-      } catch (error) {
-        console.error(`Error indexing ${file.fsPath}:`, error);
       }
     }
 
@@ -426,6 +487,25 @@ export class IndexBuilder {
    */
   public async indexFile(filePath: string): Promise<ParsedRstFile> {
     const content = await fs.promises.readFile(filePath, 'utf-8');
+    const { parsed, removedIds } = this.applyFile(filePath, content);
+
+    // Emit update event
+    const addedIds = parsed.requirements.map(r => r.id);
+    if (removedIds.length > 0 || addedIds.length > 0) {
+      this.onIndexUpdateEmitter.fire({
+        type: removedIds.length > 0 ? 'update' : 'add',
+        affectedIds: [...new Set([...removedIds, ...addedIds])],
+        file: filePath,
+      });
+    }
+
+    return parsed;
+  }
+
+  /**
+   * Parse file content and replace the file's entries in the index
+   */
+  private applyFile(filePath: string, content: string): { parsed: ParsedRstFile; removedIds: string[] } {
     const parsed = parseRstFile(content, filePath, this.config);
 
     // Remove old requirements from this file
@@ -439,17 +519,7 @@ export class IndexBuilder {
     // Store references
     this.references.set(filePath, parsed.references);
 
-    // Emit update event
-    const addedIds = parsed.requirements.map(r => r.id);
-    if (removedIds.length > 0 || addedIds.length > 0) {
-      this.onIndexUpdateEmitter.fire({
-        type: removedIds.length > 0 ? 'update' : 'add',
-        affectedIds: [...new Set([...removedIds, ...addedIds])],
-        file: filePath,
-      });
-    }
-
-    return parsed;
+    return { parsed, removedIds };
   }
 
   /**
@@ -19,11 +19,25 @@ interface CacheData {
   references: Array<[string, RequirementReference[]]>;
 }
 
+/** Hashes of config objects, which are replaced rather than mutated on reload */
+const configHashes = new WeakMap<object, string>();
+
 /**
  * Simple hash function for config comparison
  */
 function hashConfig(config: unknown): string {
-  const str = JSON.stringify(config);
+  if (typeof config === 'object' && config !== null) {
+    let hash = configHashes.get(config);
+    if (hash === undefined) {
+      hash = computeHash(JSON.stringify(config));
+      configHashes.set(config, hash);
+    }
+    return hash;
+  }
+  return computeHash(JSON.stringify(config) ?? '');
+}
+
+function computeHash(str: string): string {
   let hash = 0;
   for (let i = 0; i < str.length; i++) {
     const char = str.charCodeAt(i);
@@ -65,9 +79,11 @@ export async function saveIndexCache(
       await fs.promises.mkdir(vscodePath, { recursive: true });
     }
 
+    // Compact output: the cache is machine-read only and indentation
+    // roughly doubles its size and load time on large projects
     await fs.promises.writeFile(
       cachePath,
-      JSON.stringify(cacheData, null, 2),
+      JSON.stringify(cacheData),
       'utf-8'
     );
   } catch (error) {
@@ -111,16 +127,14 @@ export async function loadIndexCache(
     const cacheTime = cacheData.timestamp;
     const rstFiles = await vscode.workspace.findFiles('**/*.rst', '**/node_modules/**', 100);
 
-    for (const file of rstFiles) {
-      try {
-        const stat = await fs.promises.stat(file.fsPath);
-        if (stat.mtimeMs > cacheTime) {
-          console.log('RST files modified since cache, rebuilding...');
-          return false;
-        }
-      } catch {
-        // Ignore stat errors
-      }
+    // Stat all files in one round trip rather than one await per file;
+    // stat errors are ignored
+    const mtimes = await Promise.all(
+      rstFiles.map(file => fs.promises.stat(file.fsPath).then(stat => stat.mtimeMs, () => 0))
+    );
+    if (mtimes.some(mtime => mtime > cacheTime)) {
+      console.log('RST files modified since cache, rebuilding...');
+      return false;
     }
 
     // Import cached data
@@ -180,9 +194,13 @@ export class IndexCacheManager {
    * Update configuration
    */
   public updateConfig(config: unknown): void {
+    const changed = hashConfig(config) !== hashConfig(this.config);
     this.config = config;
-    // Invalidate cache when config changes
-    clearIndexCache(this.workspaceRoot);
+    // Invalidate cache only when the indexed config actually changed;
+    // theme-only edits and no-op reloads keep the cache usable
+    if (changed) {
+      clearIndexCache(this.workspaceRoot);
+    }
   }
 
   /**
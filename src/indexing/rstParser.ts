@@ -9,7 +9,7 @@ import {
   PreceptConfig,
   SourceLocation,
 } from '../types';
-import { getLinkOptionNames } from '../configuration/defaults';
+import { getLinkOptionNames, getLinkOptionSet, canonicalizeConfigValue } from '../configuration/defaults';
 
 // Regex patterns for RST parsing
 const ITEM_DIRECTIVE_REGEX = /^\.\.\s+item::\s*(.*)$/;
@@ -19,6 +19,12 @@ const OPTION_REGEX = /^\s+:(\w+):\s*(.*)$/;
 const INLINE_ITEM_REGEX = /:item:`([^`]+)`/g;
 const INDENT_REGEX = /^(\s+)/;
 
+// Reserved options that are not stored in metadata
+const RESERVED_OPTIONS: ReadonlySet<string> = new Set([
+  'id', 'type', 'level', 'status', 'baseline',
+  'signature', 'signed_by', 'signed_date', 'signed_hash',
+]);
+
 type DirectiveType = 'item' | 'graphic' | 'code';
 
 interface ParseState {
@@ -122,18 +128,12 @@ function buildRequirement(
     return null;
   }
 
-  const linkOptions = new Set(getLinkOptionNames(config));
+  const linkOptions = getLinkOptionSet(config);
   const links: Record<string, string[]> = {};
   const metadata: Record<string, string> = {};
 
-  // Reserved options that are not stored in metadata
-  const reservedOptions = new Set([
-    'id', 'type', 'level', 'status', 'baseline',
-    'signature', 'signed_by', 'signed_date', 'signed_hash',
-  ]);
-
   for (const [key, value] of state.currentOptions) {
-    if (reservedOptions.has(key)) {
+    if (RESERVED_OPTIONS.has(key)) {
       continue;
     }
     if (linkOptions.has(key)) {
@@ -151,13 +151,16 @@ function buildRequirement(
     links['references'] = [...new Set([...existing, ...inlineRefIds])];
   }
 
+  const level = state.currentOptions.get('level');
+  const status = state.currentOptions.get('status');
+
   return {
     id,
-    type,
-    level: state.currentOptions.get('level'),
+    type: canonicalizeConfigValue(config, type),
+    level: level && canonicalizeConfigValue(config, level),
     title: state.currentTitle,
     description: bodyText.trim(),
-    status: state.currentOptions.get('status'),
+    status: status && canonicalizeConfigValue(config, status),
     links,
     metadata,
     location: {
@@ -225,7 +228,7 @@ function findLinkReferences(
   config: PreceptConfig
 ): RequirementReference[] {
   const references: RequirementReference[] = [];
-  const linkOptions = new Set(getLinkOptionNames(config));
+  const linkOptions = getLinkOptionSet(config);
 
   for (const [key, value] of options) {
     if (linkOptions.has(key)) {
@@ -437,6 +440,23 @@ export function parseRequirementAtLine(
   return null;
 }
 
+/** Global-flag copies of configured ID patterns, private to this module */
+const globalIdRegexes = new WeakMap<RegExp, RegExp>();
+
+/**
+ * Get a global copy of the configured ID regex, compiled once per pattern.
+ * lastIndex is reset so every scan starts at the beginning of the line.
+ */
+function getGlobalIdRegex(config: PreceptConfig): RegExp {
+  let idRegex = globalIdRegexes.get(config.id_regex);
+  if (!idRegex) {
+    idRegex = new RegExp(config.id_regex.source, 'g');
+    globalIdRegexes.set(config.id_regex, idRegex);
+  }
+  idRegex.lastIndex = 0;
+  return idRegex;
+}
+
 /**
  * Find requirement ID at a specific position in text
  */
@@ -445,8 +465,7 @@ export function findIdAtPosition(
   column: number,
   config: PreceptConfig
 ): string | null {
-  // Create a fresh regex for this search
-  const idRegex = new RegExp(config.id_regex.source, 'g');
+  const idRegex = getGlobalIdRegex(config);
 
   let match;
   while ((match = idRegex.exec(line)) !== null) {
@@ -456,6 +475,9 @@ export function findIdAtPosition(
     if (column >= start && column <= end) {
       return match[0];
     }
+    if (start > column) {
+      break;
+    }
   }
 
   return null;
@@ -465,15 +487,22 @@ export function findIdAtPosition(
  * Get all requirement IDs mentioned in a line
  */
 export function getIdsInLine(line: string, config: PreceptConfig): string[] {
-  const ids: string[] = [];
-  const idRegex = new RegExp(config.id_regex.source, 'g');
+  return line.match(getGlobalIdRegex(config)) ?? [];
+}
 
-  let match;
-  while ((match = idRegex.exec(line)) !== null) {
-    ids.push(match[0]);
-  }
+/** `:option:` patterns per config, one per link option */
+const linkOptionPatterns = new WeakMap<PreceptConfig, RegExp[]>();
 
-  return ids;
+function getLinkOptionPatterns(config: PreceptConfig): RegExp[] {
+  let patterns = linkOptionPatterns.get(config);
+  if (!patterns) {
+    patterns = getLinkOptionNames(config).map(option => {
+      const escaped = option.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+      return new RegExp(`:${escaped}:\\s*`);
+    });
+    linkOptionPatterns.set(config, patterns);
+  }
+  return patterns;
 }
 
 /**
@@ -484,11 +513,7 @@ export function isInLinkContext(
   column: number,
   config: PreceptConfig
 ): boolean {
-  const linkOptions = getLinkOptionNames(config);
-
-  for (const option of linkOptions) {
-    const escaped = option.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
-    const pattern = new RegExp(`:${escaped}:\\s*`);
+  for (const pattern of getLinkOptionPatterns(config)) {
     const match = line.match(pattern);
     if (match && match.index !== undefined) {
       const optionEnd = match.index + match[0].length;
@@ -7,7 +7,7 @@ import * as path from 'path';
 import { IndexBuilder } from '../indexing/indexBuilder';
 import { PreceptConfig, RequirementObject, Level } from '../types';
 import { isInLinkContext, isInInlineItemContext } from '../indexing/rstParser';
-import { getLinkOptionNames, getStatusNames, getObjectTypeInfo, getLevelInfo, getCustomFieldNames, getCustomFieldValues, buildIdRegex, parseIdNumber } from '../configuration/defaults';
+import { getLinkOptionSet, getStatusNames, getObjectTypeInfo, getLevelInfo, getCustomFieldNames, getCustomFieldValues, buildIdRegex, parseIdNumber } from '../configuration/defaults';
 import { generateNextId } from '../utils/idGenerator';
 import { resolveImageDirectory, listImageFiles, computeRelativePath } from '../utils/imageUtils';
 
@@ -585,8 +585,7 @@ export class RequirementCompletionProvider implements vscode.CompletionItemProvi
             return createCustomFieldCompletions(this.config, attrContext.attributeName, attrContext.replaceRange);
           }
           // For link attributes, provide ID completions
-          const linkOptions = getLinkOptionNames(this.config);
-          if (linkOptions.includes(attrContext.attributeName)) {
+          if (getLinkOptionSet(this.config).has(attrContext.attributeName)) {
             const requirements = this.indexBuilder.getAllRequirements();
             return requirements.map(req => createCompletionItem(req, this.config));
           }
@@ -654,9 +653,8 @@ export class RequirementCompletionProvider implements vscode.CompletionItemProvi
       items.push(...idItems);
     } else if (!directiveInfo.isAtDirectivePosition) {
       // Check if the user just typed a colon after a link option name
-      const linkOptions = getLinkOptionNames(this.config);
       const colonMatch = linePrefix.match(/:(\w+):\s*$/);
-      if (colonMatch && linkOptions.includes(colonMatch[1])) {
+      if (colonMatch && getLinkOptionSet(this.config).has(colonMatch[1])) {
         // Just entered a link field, show ID completions
         const idItems = requirements.map(req => createCompletionItem(req, this.config));
         items.push(...idItems);
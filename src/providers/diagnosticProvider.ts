@@ -6,7 +6,7 @@ import * as vscode from 'vscode';
 import { IndexBuilder } from '../indexing/indexBuilder';
 import { PreceptConfig, DiagnosticType, ValidationIssue } from '../types';
 import { parseRstFile, getIdsInLine } from '../indexing/rstParser';
-import { getStatusNames, getObjectTypeValues, getLinkOptionNames } from '../configuration/defaults';
+import { getStatusNames, getObjectTypeValues } from '../configuration/defaults';
 import { getValidationDebounceMs, isAutoValidationEnabled, isValidateOnSaveEnabled } from '../configuration/settingsManager';
 import { computeContentHash } from '../signing/canonicalHash';
 import * as fs from 'fs';
@@ -84,7 +84,6 @@ export function validateFile(
   const issues: ValidationIssue[] = [];
   const validStatuses = new Set(getStatusNames(config));
   const validObjectTypes = new Set(getObjectTypeValues(config));
-  const linkOptions = new Set(getLinkOptionNames(config));
 
   // Parse the file
   const parsed = parseRstFile(content, filePath, config);
@@ -161,6 +161,9 @@ describe('directiveRenderer', () => {
         statusIndex: new Map(),
         linkGraph: new Map(),
         baselines: new Map(),
+        incomingLinks: new Map([
+          ['REQ-001', new Map([['satisfies', new Set(['REQ-002'])]])],
+        ]),
       };
 
       const rst = [
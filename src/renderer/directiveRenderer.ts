@@ -15,10 +15,25 @@ import { PreceptConfig, RequirementIndex } from '../types';
 import { renderBlockNodes } from './htmlEmitter';
 import { encodePlantUml } from './plantumlRenderer';
 import { computeContentHash } from '../signing/canonicalHash';
-import hljs from 'highlight.js';
+import { getObjectTypeInfo, getLevelInfo, getLinkTypeInfo, resolveStatus } from '../configuration/defaults';
 
 const DEFAULT_PLANTUML_SERVER = 'https://www.plantuml.com/plantuml/svg/';
 
+type HighlightJs = typeof import('highlight.js').default;
+
+let highlighter: HighlightJs | null = null;
+
+/**
+ * Load highlight.js on first use. Importing it registers every bundled
+ * language grammar, so documents without code listings never pay for it.
+ */
+function getHighlighter(): HighlightJs {
+  if (!highlighter) {
+    highlighter = require('highlight.js') as HighlightJs;
+  }
+  return highlighter;
+}
+
 /**
  * Context for rendering directives, providing access to config and index.
  */
@@ -40,7 +55,7 @@ export interface RenderContext {
 export function renderItemDirective(node: ItemDirectiveNode, ctx: RenderContext): string {
   const { config } = ctx;
   const typeClass = `precept-type-${node.itemType}`;
-  const statusClass = `precept-status-${node.status}`;
+  const statusClass = `precept-status-${resolveStatus(config, node.status)}`;
   const idAttr = node.id ? ` id="req-${escapeAttr(node.id)}"` : '';
 
   const parts: string[] = [];
@@ -93,7 +108,7 @@ export function renderItemDirective(node: ItemDirectiveNode, ctx: RenderContext)
 // ---------------------------------------------------------------------------
 
 export function renderGraphicDirective(node: GraphicDirectiveNode, ctx: RenderContext): string {
-  const statusClass = `precept-status-${node.status}`;
+  const statusClass = `precept-status-${resolveStatus(ctx.config, node.status)}`;
   const idAttr = node.id ? ` id="fig-${escapeAttr(node.id)}"` : '';
 
   const parts: string[] = [];
@@ -161,7 +176,7 @@ export function renderGraphicDirective(node: GraphicDirectiveNode, ctx: RenderCo
 // ---------------------------------------------------------------------------
 
 export function renderListingDirective(node: ListingDirectiveNode, ctx: RenderContext): string {
-  const statusClass = `precept-status-${node.status}`;
+  const statusClass = `precept-status-${resolveStatus(ctx.config, node.status)}`;
   const idAttr = node.id ? ` id="code-${escapeAttr(node.id)}"` : '';
 
   const parts: string[] = [];
@@ -231,7 +246,7 @@ function buildItemMetadataRows(node: ItemDirectiveNode, config: PreceptConfig, i
   }
 
   // Status
-  rows.push({ label: 'Status', value: titleCase(node.status), isLink: false });
+  rows.push({ label: 'Status', value: titleCase(resolveStatus(config, node.status)), isLink: false });
 
   // Value (for parameters)
   if (node.options.value) {
@@ -267,7 +282,7 @@ function buildGraphicMetadataRows(node: GraphicDirectiveNode, config: PreceptCon
     rows.push({ label: 'Level', value: getLevelTitle(config, node.level), isLink: false });
   }
 
-  rows.push({ label: 'Status', value: titleCase(node.status), isLink: false });
+  rows.push({ label: 'Status', value: titleCase(resolveStatus(config, node.status)), isLink: false });
 
   addLinkRows(rows, node.options, config);
   addExtraOptionRows(rows, node.options, config);
@@ -289,7 +304,7 @@ function buildListingMetadataRows(node: ListingDirectiveNode, config: PreceptCon
     rows.push({ label: 'Level', value: getLevelTitle(config, node.level), isLink: false });
   }
 
-  rows.push({ label: 'Status', value: titleCase(node.status), isLink: false });
+  rows.push({ label: 'Status', value: titleCase(resolveStatus(config, node.status)), isLink: false });
 
   addLinkRows(rows, node.options, config);
   addExtraOptionRows(rows, node.options, config);
@@ -303,29 +318,25 @@ function addLinkRows(rows: MetadataRow[], options: Record<string, string>, confi
 
   for (const opt of linkOptions) {
     if (options[opt]) {
-      let label = opt.replace(/_/g, ' ');
-      for (const lt of config.linkTypes) {
-        if (lt.option === opt) {
-          label = lt.outgoing.replace(/_/g, ' ');
-          break;
-        }
-      }
+      const lt = getLinkTypeInfo(config, opt);
+      const label = (lt ? lt.outgoing : opt).replace(/_/g, ' ');
       rows.push({ label: titleCase(label), value: options[opt], isLink: true });
     }
   }
 }
 
+/** Options rendered elsewhere in the metadata table (or not at all) */
+const KNOWN_OPTIONS: ReadonlySet<string> = new Set([
+  'id', 'type', 'level', 'status', 'value', 'term', 'file', 'alt', 'scale', 'caption', 'language',
+  'signature', 'signed_by', 'signed_date', 'signed_hash',
+]);
+
 function addExtraOptionRows(rows: MetadataRow[], options: Record<string, string>, _config: PreceptConfig): void {
   // Extra options are not currently stored in PreceptConfig, but we can detect them
-  const knownOptions = new Set([
-    'id', 'type', 'level', 'status', 'value', 'term', 'file', 'alt', 'scale', 'caption', 'language',
-    'signature', 'signed_by', 'signed_date', 'signed_hash',
-  ]);
-
   for (const [key, value] of Object.entries(options)) {
-    if (knownOptions.has(key)) continue;
+    if (KNOWN_OPTIONS.has(key)) continue;
     // Skip link types (already handled)
-    if (_config.linkTypes.some(lt => lt.option === key)) continue;
+    if (getLinkTypeInfo(_config, key)) continue;
     // Skip custom fields (handled separately)
     if (key in _config.customFields) continue;
 
@@ -352,20 +363,15 @@ function addCustomFieldRows(rows: MetadataRow[], options: Record<string, string>
 function addIncomingLinkRows(rows: MetadataRow[], itemId: string, config: PreceptConfig, index?: RequirementIndex): void {
   if (!index || !itemId) return;
 
-  // Build incoming links from the linkGraph
-  // For each item that has a link TO this item, find what link type it is
-  const allObjects = index.objects;
   const incoming: Record<string, string[]> = {};
 
-  for (const [sourceId, sourceObj] of allObjects) {
-    if (sourceId === itemId) continue;
-
-    for (const [linkType, targetIds] of Object.entries(sourceObj.links)) {
-      if (targetIds.includes(itemId)) {
-        if (!incoming[linkType]) {
-          incoming[linkType] = [];
-        }
-        incoming[linkType].push(sourceId);
+  // Sources that link TO this item, from the reverse-link index
+  const byType = index.incomingLinks.get(itemId);
+  if (byType) {
+    for (const [linkType, sourceIds] of byType) {
+      const ids = Array.from(sourceIds).filter(id => id !== itemId);
+      if (ids.length > 0) {
+        incoming[linkType] = ids;
       }
     }
   }
@@ -461,28 +467,17 @@ function renderSignatureBlock(options: Record<string, string>, isStale: boolean)
 // ---------------------------------------------------------------------------
 
 function getTypeTitle(config: PreceptConfig, itemType: string): string {
-  for (const ot of config.objectTypes) {
-    if (ot.type === itemType) {
-      return ot.title || titleCase(itemType);
-    }
-  }
-  return titleCase(itemType);
+  return getObjectTypeInfo(config, itemType)?.title || titleCase(itemType);
 }
 
 function getLevelTitle(config: PreceptConfig, level: string): string {
-  for (const lv of config.levels) {
-    if (lv.level === level) {
-      return lv.title || titleCase(level);
-    }
-  }
-  return titleCase(level);
+  return getLevelInfo(config, level)?.title || titleCase(level);
 }
 
 function getIncomingLabel(config: PreceptConfig, linkType: string): string {
-  for (const lt of config.linkTypes) {
-    if (lt.option === linkType) {
-      return titleCase(lt.incoming.replace(/_/g, ' '));
-    }
+  const lt = getLinkTypeInfo(config, linkType);
+  if (lt) {
+    return titleCase(lt.incoming.replace(/_/g, ' '));
   }
   return titleCase(`${linkType} (incoming)`.replace(/_/g, ' '));
 }
@@ -497,14 +492,15 @@ function titleCase(str: string): string {
  */
 export function highlightCode(code: string, language?: string): string {
   try {
-    if (language && language !== 'text' && hljs.getLanguage(language)) {
-      const result = hljs.highlight(code, { language });
-      return `<pre><code class="hljs language-${escapeAttr(language)}">${result.value}</code></pre>`;
-    }
-    // Auto-detect or plain
+    // Plain text never needs the highlighter
     if (!language || language === 'text') {
       return `<pre><code>${escapeHtml(code)}</code></pre>`;
     }
+    const hljs = getHighlighter();
+    if (hljs.getLanguage(language)) {
+      const result = hljs.highlight(code, { language });
+      return `<pre><code class="hljs language-${escapeAttr(language)}">${result.value}</code></pre>`;
+    }
     // Language not recognized — try auto-detect
     const result = hljs.highlightAuto(code);
     return `<pre><code class="hljs">${result.value}</code></pre>`;
@@ -568,7 +568,7 @@ function createItemDirectiveNode(
     id: options.id || '',
     itemType: options.type || 'requirement',
     level: options.level || '',
-    status: options.status || 'draft',
+    status: options.status || '',
     options,
     content: contentLines,
     contentNodes,
@@ -589,7 +589,7 @@ function createGraphicDirectiveNode(
     title: title || '',
     id: options.id || '',
     level: options.level || '',
-    status: options.status || 'draft',
+    status: options.status || '',
     file: options.file || '',
     alt: options.alt || title || 'Graphic',
     scale: options.scale || '',
@@ -610,7 +610,7 @@ function createListingDirectiveNode(
     title: title || '',
     id: options.id || '',
     level: options.level || '',
-    status: options.status || 'draft',
+    status: options.status || '',
     language: options.language || 'text',
     caption: options.caption || '',
     options,
@@ -180,7 +180,7 @@ export interface ItemDirectiveNode {
   id: string;
   itemType: string;
   level: string;
-  status: string;
+  status: string;                   // declared :status:, '' when absent
   options: Record<string, string>;  // all directive options
   content: string[];                // raw RST content lines
   contentNodes: BlockNode[];        // parsed content
@@ -191,7 +191,7 @@ export interface GraphicDirectiveNode {
   title: string;
   id: string;
   level: string;
-  status: string;
+  status: string;                   // declared :status:, '' when absent
   file: string;
   alt: string;
   scale: string;
@@ -206,7 +206,7 @@ export interface ListingDirectiveNode {
   title: string;
   id: string;
   level: string;
-  status: string;
+  status: string;                   // declared :status:, '' when absent
   language: string;
   caption: string;
   options: Record<string, string>;
@@ -100,6 +100,7 @@ export interface PreceptConfig {
   idConfig: IdConfig;           // ID generation configuration
   linkTypes: LinkType[];
   statuses: Status[];
+  defaultStatus?: string;       // Status assumed for items without :status: (default: "draft")
   customFields: CustomFields;   // Custom fields with enumerated values (e.g., product, priority)
   headingStyles: HeadingStyle[]; // Section heading styles, index 0 = h1, index 5 = h6
   id_regex: RegExp;             // Pattern for project-unique IDs (e.g., /\d{4}/g or /[A-Z]+-\d{4}/g)
@@ -151,6 +152,7 @@ export interface RequirementIndex {
   statusIndex: Map<string, Set<string>>;       // status -> set of IDs
   linkGraph: Map<string, Set<string>>;         // id -> set of linked IDs (all directions)
   baselines: Map<string, Set<string>>;         // baseline -> set of IDs
+  incomingLinks: Map<string, Map<string, Set<string>>>; // target id -> link type -> source IDs
 }
 
 /**
@@ -292,6 +294,8 @@ export interface ConfigLoadResult {
   theme?: string;
   /** Mobile breakpoint in pixels for sidebar hamburger menu (default: 1000) */
   mobileBreakpoint?: number;
+  /** Path to the precept.json the config was loaded from */
+  configPath?: string;
   /** Path to the config file that failed to parse */
   failedConfigPath?: string;
 }
@@ -35,6 +35,7 @@ function createMockIndex(requirements: RequirementObject[]): RequirementIndex {
     statusIndex: new Map(),
     linkGraph: new Map(),
     baselines: new Map(),
+    incomingLinks: new Map(),
   };
 
   for (const req of requirements) {
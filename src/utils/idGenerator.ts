@@ -6,7 +6,7 @@
  */
 
 import { RequirementObject, IdConfig } from '../types';
-import { formatId, parseIdNumber } from '../configuration/defaults';
+import { formatId, createIdFormatter, parseIdNumber } from '../configuration/defaults';
 
 /**
  * Extract numeric part from an ID based on IdConfig
@@ -168,13 +168,14 @@ export function generateUniqueId(
   idConfig: IdConfig,
   requirements: RequirementObject[]
 ): string {
+  const format = createIdFormatter(idConfig);
   let nextId = generateNextId(idConfig, requirements);
 
   // Safety check - ensure no collision (should not happen normally)
   while (idExists(nextId, requirements)) {
     const num = parseIdNumber(idConfig, nextId);
     if (num !== null) {
-      nextId = formatId(idConfig, num + 1);
+      nextId = format(num + 1);
     } else {
       break;
     }
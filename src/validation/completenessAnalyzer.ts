@@ -179,15 +179,16 @@ export function analyzeBaselineStability(
   for (const req of baselinedReqs) {
     // Check if baselined requirement is approved/implemented
     if (config.baselineStability.requireApproved) {
-      const status = (req.status || 'draft').toLowerCase();
-      if (status !== 'approved' && status !== 'implemented' && status !== 'baselined') {
+      const status = req.status || config.defaultStatus;
+      const normalized = status.toLowerCase();
+      if (normalized !== 'approved' && normalized !== 'implemented' && normalized !== 'baselined') {
         issues.push({
           id: req.id,
           baseline: req.baseline!,
           issue: 'not_approved',
           severity: ValidationSeverity.HIGH,
           affectedIds: [req.id],
-          details: `Baselined requirement ${req.id} has status '${req.status}' but should be approved/implemented`
+          details: `Baselined requirement ${req.id} has status '${status}' but should be approved/implemented`
         });
       }
     }
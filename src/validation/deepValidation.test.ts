@@ -9,8 +9,11 @@ import {
   getTypePrefix,
   DEFAULT_DEEP_VALIDATION_CONFIG,
   ValidationSeverity,
+  getDeepValidationConfig,
 } from './deepValidation';
+import { detectStatusInconsistencies } from './statusConsistencyValidator';
 import { RequirementObject } from '../types';
+import { DEFAULT_CONFIG } from '../configuration/defaults';
 
 function createMockRequirement(
   id: string,
@@ -159,4 +162,17 @@ describe('Deep Validation', () => {
       expect(DEFAULT_DEEP_VALIDATION_CONFIG.priorityWeightedCoverage.high).toBeLessThan(100);
     });
   });
+
+  describe('getDeepValidationConfig', () => {
+    it('should assume the configured default status for items without one', () => {
+      const config = getDeepValidationConfig({ ...DEFAULT_CONFIG, defaultStatus: 'approved' });
+      const approved = createMockRequirement('0001', 'requirement', { satisfies: ['0002'] }, 'approved');
+      const unset = createMockRequirement('0002');
+      unset.status = undefined;
+
+      expect(config.defaultStatus).toBe('approved');
+      expect(detectStatusInconsistencies([approved, unset], config)).toHaveLength(0);
+      expect(detectStatusInconsistencies([approved, unset], DEFAULT_DEEP_VALIDATION_CONFIG)).toHaveLength(1);
+    });
+  });
 });
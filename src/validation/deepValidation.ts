@@ -13,6 +13,7 @@
  */
 
 import { RequirementObject, PreceptConfig, LinkType } from '../types';
+import { DEFAULT_STATUS, resolveStatus } from '../configuration/defaults';
 
 /**
  * Severity levels for validation issues
@@ -197,6 +198,7 @@ export interface DeepValidationConfig {
     medium: ValidationSeverity;
     low: ValidationSeverity;
   };
+  defaultStatus: string;  // Status assumed for items without :status:
 }
 
 /**
@@ -258,7 +260,8 @@ export const DEFAULT_DEEP_VALIDATION_CONFIG: DeepValidationConfig = {
     high: ValidationSeverity.HIGH,
     medium: ValidationSeverity.MEDIUM,
     low: ValidationSeverity.LOW
-  }
+  },
+  defaultStatus: DEFAULT_STATUS
 };
 
 /**
@@ -266,8 +269,11 @@ export const DEFAULT_DEEP_VALIDATION_CONFIG: DeepValidationConfig = {
  */
 export function getDeepValidationConfig(preceptConfig?: PreceptConfig): DeepValidationConfig {
   // In future, parse from preceptConfig.extra.precept_validation_thresholds
-  // For now, use defaults
-  return DEFAULT_DEEP_VALIDATION_CONFIG;
+  // For now, use defaults apart from the project's default status
+  if (!preceptConfig) {
+    return DEFAULT_DEEP_VALIDATION_CONFIG;
+  }
+  return { ...DEFAULT_DEEP_VALIDATION_CONFIG, defaultStatus: resolveStatus(preceptConfig) };
 }
 
 /**
@@ -25,7 +25,7 @@ export function detectStatusInconsistencies(
   const inconsistencies: StatusInconsistency[] = [];
   
   for (const req of requirements) {
-    const fromStatus = req.status || 'draft';
+    const fromStatus = req.status || config.defaultStatus;
     
     // Check all outgoing links
     for (const [linkType, targetIds] of Object.entries(req.links)) {
@@ -33,7 +33,7 @@ export function detectStatusInconsistencies(
         const target = getRequirementById(requirements, targetId);
         if (!target) continue;
         
-        const toStatus = target.status || 'draft';
+        const toStatus = target.status || config.defaultStatus;
         const violation = detectStatusViolation(fromStatus, toStatus, config);
         
         if (violation) {
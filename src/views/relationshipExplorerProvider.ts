@@ -13,6 +13,7 @@
 import * as vscode from 'vscode';
 import { IndexBuilder } from '../indexing/indexBuilder';
 import { PreceptConfig, RequirementObject } from '../types';
+import { getLinkTypeInfo } from '../configuration/defaults';
 
 /**
  * Direction icons for relationship display
@@ -292,7 +293,7 @@ export class RelationshipExplorerProvider implements vscode.TreeDataProvider<Rel
       // Group by outgoing link types
       for (const [linkType, ids] of Object.entries(selectedReq.links)) {
         if (ids.length > 0) {
-          const linkTypeInfo = this.config.linkTypes.find(lt => lt.option === linkType);
+          const linkTypeInfo = getLinkTypeInfo(this.config, linkType);
           const displayName = linkTypeInfo?.outgoing || linkType;
 
           items.push(new RelationshipTreeItem(
@@ -311,7 +312,7 @@ export class RelationshipExplorerProvider implements vscode.TreeDataProvider<Rel
 
       for (const [linkType, ids] of Object.entries(incomingLinks)) {
         if (ids.length > 0) {
-          const linkTypeInfo = this.config.linkTypes.find(lt => lt.option === linkType);
+          const linkTypeInfo = getLinkTypeInfo(this.config, linkType);
           const displayName = linkTypeInfo?.incoming || `${linkType} (reverse)`;
 
           items.push(new RelationshipTreeItem(
@@ -382,21 +383,7 @@ export class RelationshipExplorerProvider implements vscode.TreeDataProvider<Rel
    * Returns a map of link type -> array of source IDs
    */
   private getIncomingLinks(targetId: string): Record<string, string[]> {
-    const incomingLinks: Record<string, string[]> = {};
-
-    // Iterate through all requirements and find those that link to this one
-    for (const req of this.indexBuilder.getAllRequirements()) {
-      for (const [linkType, ids] of Object.entries(req.links)) {
-        if (ids.includes(targetId)) {
-          if (!incomingLinks[linkType]) {
-            incomingLinks[linkType] = [];
-          }
-          incomingLinks[linkType].push(req.id);
-        }
-      }
-    }
-
-    return incomingLinks;
+    return this.indexBuilder.getIncomingLinks(targetId);
   }
 }
 
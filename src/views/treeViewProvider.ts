@@ -8,6 +8,7 @@ import { IndexBuilder } from '../indexing/indexBuilder';
 import { PreceptConfig, RequirementObject, TreeViewGroupBy } from '../types';
 import { getTreeViewGroupBy, shouldShowStatusIcons } from '../configuration/settingsManager';
 import { computeContentHash } from '../signing/canonicalHash';
+import { getObjectTypeInfo, getLevelInfo, getStatusInfo } from '../configuration/defaults';
 
 /**
  * Status icons
@@ -289,10 +290,10 @@ export class RequirementTreeDataProvider implements vscode.TreeDataProvider<Requ
       // Get the title for the group
       let title: string;
       if (groupType === 'type') {
-        const typeInfo = this.config.objectTypes.find(t => t.type === groupValue);
+        const typeInfo = getObjectTypeInfo(this.config, groupValue);
         title = typeInfo?.title || groupValue;
       } else if (groupType === 'level') {
-        const levelInfo = this.config.levels.find(l => l.level === groupValue);
+        const levelInfo = getLevelInfo(this.config, groupValue);
         title = levelInfo?.title || (groupValue === 'unassigned' ? 'Unassigned' : groupValue);
       } else if (groupType === 'file') {
         title = vscode.workspace.asRelativePath(groupValue);
@@ -422,7 +423,7 @@ export class RequirementTreeDataProvider implements vscode.TreeDataProvider<Requ
 
     // Add type groups
     for (const [type, typeReqs] of groups) {
-      const typeInfo = this.config.objectTypes.find(t => t.type === type);
+      const typeInfo = getObjectTypeInfo(this.config, type);
       const title = typeInfo?.title || type;
 
       items.push(new RequirementTreeItem(
@@ -472,7 +473,7 @@ export class RequirementTreeDataProvider implements vscode.TreeDataProvider<Requ
 
     // Add level groups
     for (const [level, levelReqs] of groups) {
-      const levelInfo = this.config.levels.find(l => l.level === level);
+      const levelInfo = getLevelInfo(this.config, level);
       const title = levelInfo?.title || (level === 'unassigned' ? 'Unassigned' : level);
 
       items.push(new RequirementTreeItem(
@@ -556,7 +557,7 @@ export class RequirementTreeDataProvider implements vscode.TreeDataProvider<Requ
     const items: RequirementTreeItem[] = [];
 
     for (const [status, statusReqs] of groups) {
-      const statusInfo = this.config.statuses.find(s => s.status === status);
+      const statusInfo = getStatusInfo(this.config, status);
       const title = statusInfo ? status.charAt(0).toUpperCase() + status.slice(1) : status;
 
       items.push(new RequirementTreeItem(